@@ -5,6 +5,8 @@ This file adapts to the existing src/* implementations and uses safe fallbacks.
 import sys
 import time
 import random
+import asyncio
+import inspect
 from typing import List, Dict, Optional
 
 # Try to import config values if present (use safe defaults)
@@ -83,7 +85,38 @@ def choose_resume(llm: Optional[LLMEngine], resumes: ResumeManager, description:
     return selected, 0, 0.0
 
 
-def apply_with_bot(bot, url: str, resume_path: str):
+async def _maybe_await(value):
+    """Await coroutine results so sync and async bot APIs both work."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def choose_resumes(llm: Optional[LLMEngine], resumes: ResumeManager, jobs: List[Dict]) -> List[tuple]:
+    """Batch version of choose_resume: one Gemini call for many jobs.
+    Returns a (selected_resume_name, match_score, confidence) tuple per job."""
+    try:
+        available = resumes.list_available_resumes()
+        if available and len(available) == 1:
+            return [(available[0], 0, 1.0) for _ in jobs]
+    except Exception:
+        pass
+    try:
+        if llm and hasattr(llm, "select_best_resume_batch") and jobs:
+            matches = llm.select_best_resume_batch(
+                job_descriptions=[job["description"] or job["title"] for job in jobs],
+                resumes=resumes.get_all_resumes(),
+                job_titles=[job["title"] for job in jobs],
+            )
+            return [(m.get("selected_resume"), m.get("match_score", 0), m.get("confidence", 0.0)) for m in matches]
+    except Exception:
+        pass
+
+    # fallback: one call (or first resume) per job
+    return [choose_resume(llm, resumes, job["description"], job["title"]) for job in jobs]
+
+
+async def apply_with_bot(bot, url: str, resume_path: str):
     """
     Try common apply API names on bot: apply_to_job, apply_to_linkedin_job, apply.
     If none exist, open page and try a minimal 'click Easy Apply' flow using page.
@@ -91,13 +124,13 @@ def apply_with_bot(bot, url: str, resume_path: str):
     """
     try:
         if hasattr(bot, "apply_to_job"):
-            return bot.apply_to_job(url, resume_path)
+            return await _maybe_await(bot.apply_to_job(url, resume_path))
         if hasattr(bot, "apply_to_linkedin_job"):
             # expects job_data sometimes; create minimal job dict
             job = {"url": url, "description": ""}
-            return bot.apply_to_linkedin_job(job, resume_path)
+            return await _maybe_await(bot.apply_to_linkedin_job(job, resume_path))
         if hasattr(bot, "apply"):
-            return bot.apply(url, resume_path)
+            return await _maybe_await(bot.apply(url, resume_path))
     except Exception as e:
         print("⚠️ Bot apply method raised:", e)
 
@@ -106,8 +139,8 @@ def apply_with_bot(bot, url: str, resume_path: str):
         page = getattr(bot, "page", None)
         if page is None:
             return False
-        page.goto(url, timeout=60000)
-        human_sleep(1, 2)
+        await page.goto(url, timeout=60000)
+        await human_sleep(1, 2)
         # try a few selectors
         easy_selectors = [
             'button.jobs-apply-button',
@@ -117,16 +150,16 @@ def apply_with_bot(bot, url: str, resume_path: str):
         for sel in easy_selectors:
             try:
                 loc = page.locator(sel)
-                if loc.count() > 0:
-                    loc.first.click()
-                    human_sleep(0.3, 0.6)
+                if await loc.count() > 0:
+                    await loc.first.click()
+                    await human_sleep(0.3, 0.6)
                     # attempt upload if file input present and bot has upload helper
                     if hasattr(bot, "upload_file"):
                         try:
                             file_in = page.locator('input[type="file"]')
-                            if file_in.count() > 0:
-                                bot.upload_file('input[type="file"]', resume_path)
-                                human_sleep(0.5, 1)
+                            if await file_in.count() > 0:
+                                await _maybe_await(bot.upload_file('input[type="file"]', resume_path))
+                                await human_sleep(0.5, 1)
                         except Exception:
                             pass
                     # try to submit
@@ -134,9 +167,9 @@ def apply_with_bot(bot, url: str, resume_path: str):
                     for s in submit_sel:
                         try:
                             s_loc = page.locator(s)
-                            if s_loc.count() > 0:
-                                s_loc.first.click()
-                                human_sleep(0.5, 1)
+                            if await s_loc.count() > 0:
+                                await s_loc.first.click()
+                                await human_sleep(0.5, 1)
                                 return True
                         except Exception:
                             continue
@@ -148,7 +181,7 @@ def apply_with_bot(bot, url: str, resume_path: str):
     return False
 
 
-def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: int = 50) -> List[str]:
+async def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: int = 50) -> List[str]:
     """Lightweight job URL scraper using bot.page. Returns unique URLs.
 
     This version navigates directly to the LinkedIn search URL (more reliable),
@@ -166,16 +199,16 @@ def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: i
         q = quote_plus(keyword)
         loc = quote_plus(keyword if not PREFERRED_LOCATIONS else PREFERRED_LOCATIONS[0])
         search_url = f"https://www.linkedin.com/jobs/search/?keywords={q}&location={loc}&f_AL=true"
-        page.goto(search_url, wait_until="domcontentloaded")
-        human_sleep(1, 2)
+        await page.goto(search_url, wait_until="domcontentloaded")
+        await human_sleep(1, 2)
 
         # Scroll to load more results
         for _ in range(4):
             try:
-                page.evaluate("window.scrollBy(0, window.innerHeight);")
+                await page.evaluate("window.scrollBy(0, window.innerHeight);")
             except Exception:
                 pass
-            human_sleep(0.5, 1)
+            await human_sleep(0.5, 1)
 
         # Try several link selectors to be robust against DOM changes
         candidate_selectors = [
@@ -188,12 +221,12 @@ def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: i
         urls = []
         for sel in candidate_selectors:
             try:
-                elems = page.locator(sel).all()
+                elems = await page.locator(sel).all()
             except Exception:
                 elems = []
             for el in elems:
                 try:
-                    href = el.get_attribute("href")
+                    href = await el.get_attribute("href")
                     if not href:
                         continue
                     clean = href.split("?")[0]
@@ -223,7 +256,7 @@ def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: i
                 ts = int(time.time())
                 html_path = f"data/logs/no_jobs_{ts}.html"
                 with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(page.content())
+                    f.write(await page.content())
                 print(f"📄 Saved page HTML for inspection: {html_path}")
             except Exception:
                 pass
@@ -233,7 +266,102 @@ def scrape_job_urls_with_bot(bot, keyword: str = "Python Developer", max_urls: i
         return []
 
 
-def main(max_jobs: int = 10):
+async def extract_job_details(page, url: str):
+    """Open a job page and return (title, company, description)."""
+    title = "Unknown"
+    company = "Unknown"
+    description = ""
+    try:
+        await page.goto(url, timeout=60000)
+        await human_sleep(1, 2)
+        
+        # Try multiple selectors for title/company/description to avoid 'Unknown'
+        t_selectors = [
+            ".job-details-jobs-unified-top-card__job-title h1 a",  # Specific: h1 > a inside job title div
+            "h1.t-24.t-bold a",  # Class-based match for h1 > a
+            ".job-details-jobs-unified-top-card__job-title h1",  # Fallback: just the h1
+            "h1",  # Any h1 tag (usually job title)
+            ".topcard__title",
+            "h1.top-card-layout__title",
+        ]
+        c_selectors = [
+            ".job-details-jobs-unified-top-card__company-name a",  # Specific: a inside company name div
+            "div.job-details-jobs-unified-top-card__company-name a",  # More specific version
+            ".topcard__org-name-link",
+            "a[data-tracking-control-name='public_jobs_topcard-org-name']",
+            "a[href*='/company/']",  # Any company link
+        ]
+        d_selectors = [
+            ".jobs-description__content",
+            ".jobs-description-content__text",
+            "div.jobs-description",
+            "article.jobs-description",
+            ".description__text",
+            ".description",
+        ]
+
+        for sel in t_selectors:
+            try:
+                loc = page.locator(sel)
+                if await loc.count() > 0:
+                    text = (await loc.first.inner_text()).strip()
+                    if text:  # Only accept non-empty text
+                        title = text
+                        print(f"✓ Title found with selector: {sel[:50]}")
+                        break
+            except Exception:
+                continue
+        
+        if title == "Unknown":
+            print("⚠️ Could not extract job title - will try all selectors on next run")
+
+        for sel in c_selectors:
+            try:
+                loc = page.locator(sel)
+                if await loc.count() > 0:
+                    text = (await loc.first.inner_text()).strip()
+                    if text:  # Only accept non-empty text
+                        company = text
+                        print(f"✓ Company found with selector: {sel[:50]}")
+                        break
+            except Exception:
+                continue
+
+        for sel in d_selectors:
+            try:
+                loc = page.locator(sel)
+                if await loc.count() > 0:
+                    description = (await loc.first.inner_text()).strip()
+                    break
+            except Exception:
+                continue
+    except Exception as e:
+        print("⚠️ Could not load/extract page:", e)
+
+    return title, company, description
+
+
+async def prepare_job(bot, url: str) -> Dict:
+    """Scrape one job page (in its own pooled tab when available)."""
+    pool = getattr(bot, "pool", None)
+    if pool is not None:
+        async with pool.page() as page:
+            title, company, description = await extract_job_details(page, url)
+    else:
+        page = getattr(bot, "page", None)
+        title, company, description = ("Unknown", "Unknown", "")
+        if page is not None:
+            title, company, description = await extract_job_details(page, url)
+
+    return {
+        "url": url,
+        "title": title,
+        "company": company,
+        "description": description,
+    }
+
+
+async def main(max_jobs: int = 10):
     print("\n" + "=" * 60)
     print("🤖 SMART APPLY - MAIN")
     print("=" * 60)
@@ -250,7 +378,7 @@ def main(max_jobs: int = 10):
     # initialize components
     resumes = ResumeManager()
     try:
-        llm = LLMEngine()
+        llm = LLMEngine(resumes=resumes.get_all_resumes())
     except Exception as e:
         print("⚠️ LLMEngine init failed:", e)
         llm = None
@@ -261,18 +389,18 @@ def main(max_jobs: int = 10):
         bot = _BotClass(headless=HEADLESS_MODE)
         # try common launch names
         if hasattr(bot, "start_browser"):
-            bot.start_browser()
+            await _maybe_await(bot.start_browser())
         elif hasattr(bot, "launch"):
-            bot.launch()
+            await _maybe_await(bot.launch())
         elif hasattr(bot, "open"):
-            bot.open()
+            await _maybe_await(bot.open())
         # small pause for browser readiness
-            human_sleep(0.5, 1)
+            await human_sleep(0.5, 1)
     except Exception as e:
         print("❌ Failed to start bot:", e)
         if bot:
             try:
-                bot.close()
+                await _maybe_await(bot.close())
             except Exception:
                 pass
         sys.exit(1)
@@ -283,7 +411,7 @@ def main(max_jobs: int = 10):
         location = PREFERRED_LOCATIONS[0] if PREFERRED_LOCATIONS else "India"
 
         print(f"\n🔍 Scraping jobs for: {keyword} in {location}")
-        job_urls = scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
+        job_urls = await scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
         # If no job URLs found, allow a manual retry when running headful so you can login/inspect
         if not job_urls:
             print("❌ No job URLs found.")
@@ -295,7 +423,7 @@ def main(max_jobs: int = 10):
                         ts = int(time.time())
                         path = f"data/logs/no_jobs_{ts}.png"
                         try:
-                            page.screenshot(path=path, full_page=True)
+                            await page.screenshot(path=path, full_page=True)
                             print(f"📸 Saved screenshot for inspection: {path}")
                         except Exception:
                             pass
@@ -304,10 +432,10 @@ def main(max_jobs: int = 10):
 
                 # Interactive retry loop: let user log in manually then press 'r' to retry or Enter to exit
                 try:
-                    resp = input("No jobs found — log in if needed. Type 'r' then Enter to retry scraping, or just press Enter to exit: ")
+                    resp = await asyncio.to_thread(input, "No jobs found — log in if needed. Type 'r' then Enter to retry scraping, or just press Enter to exit: ")
                     if resp.strip().lower() == 'r':
                         print("🔁 Retrying scrape after manual action...")
-                        job_urls = scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
+                        job_urls = await scrape_job_urls_with_bot(bot, keyword=keyword, max_urls=max_jobs)
                         if not job_urls:
                             print("❌ Still no job URLs found after retry. Exiting.")
                             return
@@ -321,132 +449,72 @@ def main(max_jobs: int = 10):
                 print("Exiting (headless mode).")
                 return
 
+        job_urls = job_urls[:max_jobs]
         print(f"📋 Found {len(job_urls)} jobs (processing up to {max_jobs})")
 
-        applied_count = 0
-        for idx, url in enumerate(job_urls[:max_jobs], start=1):
-            print("\n" + "-" * 60)
-            print(f"📍 Job {idx}/{min(len(job_urls), max_jobs)}")
-            print(url)
-            # load job page & try to extract useful info
-            page = getattr(bot, "page", None)
-            title = "Unknown"
-            company = "Unknown"
-            description = ""
-            if page is not None:
-                try:
-                    page.goto(url, timeout=60000)
-                    human_sleep(1, 2)
-                    
-                    # Try multiple selectors for title/company/description to avoid 'Unknown'
-                    t_selectors = [
-                        ".job-details-jobs-unified-top-card__job-title h1 a",  # Specific: h1 > a inside job title div
-                        "h1.t-24.t-bold a",  # Class-based match for h1 > a
-                        ".job-details-jobs-unified-top-card__job-title h1",  # Fallback: just the h1
-                        "h1",  # Any h1 tag (usually job title)
-                        ".topcard__title",
-                        "h1.top-card-layout__title",
-                    ]
-                    c_selectors = [
-                        ".job-details-jobs-unified-top-card__company-name a",  # Specific: a inside company name div
-                        "div.job-details-jobs-unified-top-card__company-name a",  # More specific version
-                        ".topcard__org-name-link",
-                        "a[data-tracking-control-name='public_jobs_topcard-org-name']",
-                        "a[href*='/company/']",  # Any company link
-                    ]
-                    d_selectors = [
-                        ".jobs-description__content",
-                        ".jobs-description-content__text",
-                        "div.jobs-description",
-                        "article.jobs-description",
-                        ".description__text",
-                        ".description",
-                    ]
-
-                    for sel in t_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                text = loc.first.inner_text().strip()
-                                if text:  # Only accept non-empty text
-                                    title = text
-                                    print(f"✓ Title found with selector: {sel[:50]}")
-                                    break
-                        except Exception:
-                            continue
-                    
-                    if title == "Unknown":
-                        print("⚠️ Could not extract job title - will try all selectors on next run")
+        # 1. Read every job page (tabs run in parallel)
+        jobs = await asyncio.gather(*[prepare_job(bot, url) for url in job_urls])
 
-                    for sel in c_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                text = loc.first.inner_text().strip()
-                                if text:  # Only accept non-empty text
-                                    company = text
-                                    print(f"✓ Company found with selector: {sel[:50]}")
-                                    break
-                        except Exception:
-                            continue
+        # Pick resumes for all jobs at once (Gemini call is blocking - keep it off the event loop)
+        choices = await asyncio.to_thread(choose_resumes, llm, resumes, jobs)
+        for job, (selected_resume, score, confidence) in zip(jobs, choices):
+            job.update(resume=selected_resume, score=score, confidence=confidence)
 
-                    for sel in d_selectors:
-                        try:
-                            loc = page.locator(sel)
-                            if loc.count() > 0:
-                                description = loc.first.inner_text().strip()
-                                break
-                        except Exception:
-                            continue
-                except Exception as e:
-                    print("⚠️ Could not load/extract page:", e)
+        # 2. Keep only jobs we have a resume for, within today's cap
+        try:
+            remaining = max(0, MAX_APPLICATIONS_PER_DAY - logger.get_today_count())
+        except Exception:
+            remaining = len(jobs)
 
-            selected_resume, score, confidence = choose_resume(llm, resumes, description, title)
-            if not selected_resume:
+        ready = []
+        for idx, job in enumerate(jobs, start=1):
+            print("\n" + "-" * 60)
+            print(f"📍 Job {idx}/{len(jobs)}: {job['title']} @ {job['company']}")
+            print(job["url"])
+            if not job["resume"]:
                 print("❌ No resume available. Skipping job.")
                 continue
-
-            resume_path = resumes.get_resume_path(selected_resume)
-            if not resume_path:
-                print(f"❌ Resume path missing for {selected_resume}. Skipping.")
+            job["resume_path"] = resumes.get_resume_path(job["resume"])
+            if not job["resume_path"]:
+                print(f"❌ Resume path missing for {job['resume']}. Skipping.")
                 continue
-
-            if DRY_RUN:
-                print("🧪 DRY RUN - not actually applying. Logging only.")
-                result = "DRY_RUN"
-                success = True
-            else:
-                print("📝 Applying...")
-                result = apply_with_bot(bot, url, resume_path)
-                success = bool(result)
-
+            if len(ready) >= remaining:
+                print(f"\n🛑 Reached daily cap ({MAX_APPLICATIONS_PER_DAY}). Stopping.")
+                break
+            ready.append(job)
+
+        # 3. Apply (concurrently when the bot supports it)
+        if DRY_RUN:
+            print("🧪 DRY RUN - not actually applying. Logging only.")
+            results = ["DRY_RUN"] * len(ready)
+        elif hasattr(bot, "apply_to_jobs"):
+            print(f"📝 Applying to {len(ready)} jobs...")
+            results = await bot.apply_to_jobs([(job["url"], job["resume_path"]) for job in ready])
+        else:
+            print(f"📝 Applying to {len(ready)} jobs...")
+            results = [await apply_with_bot(bot, job["url"], job["resume_path"]) for job in ready]
+
+        # 4. Log everything
+        applied_count = 0
+        for job, result in zip(ready, results):
+            success = bool(result)
             status = "Success" if success else "Failed"
             logger.log_application(
-                job_title=title,
-                company=company,
+                job_title=job["title"],
+                company=job["company"],
                 platform="LinkedIn",
-                resume_used=selected_resume,
-                match_score=score,
-                confidence=confidence,
+                resume_used=job["resume"],
+                match_score=job["score"],
+                confidence=job["confidence"],
                 status=status,
                 location=location,
-                application_url=url,
+                application_url=job["url"],
                 notes=str(result)[:1000] if result else ""
             )
 
             if success:
                 applied_count += 1
 
-            # polite pause & stop if reached daily cap
-                human_sleep(0.3, 0.6)
-            try:
-                today_count = logger.get_today_count()
-                if today_count >= MAX_APPLICATIONS_PER_DAY:
-                    print(f"\n🛑 Reached daily cap ({today_count}/{MAX_APPLICATIONS_PER_DAY}). Stopping.")
-                    break
-            except Exception:
-                pass
-
         print("\n" + "=" * 60)
         print(f"Session applied count: {applied_count}")
         stats = logger.get_statistics()
@@ -460,9 +528,9 @@ def main(max_jobs: int = 10):
         try:
             if bot:
                 if hasattr(bot, "close"):
-                    bot.close()
+                    await _maybe_await(bot.close())
                 elif hasattr(bot, "stop_browser"):
-                    bot.stop_browser()
+                    await _maybe_await(bot.stop_browser())
         except Exception:
             pass
         try:
@@ -474,4 +542,4 @@ def main(max_jobs: int = 10):
 
 
 if __name__ == "__main__":
-    main(max_jobs=10)
\ No newline at end of file
+    asyncio.run(main(max_jobs=10))
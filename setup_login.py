@@ -3,7 +3,6 @@
 Run this once to save your session. 
 """
 
-import time
 from playwright.sync_api import sync_playwright
 from pathlib import Path
 
@@ -11,6 +10,7 @@ from pathlib import Path
 # ⚙️ CONFIGURATION
 # ---------------------------------------------------------
 PROFILE_DIR = "data/chrome_profile"  # Where cookies/session are saved
+STATE_FILE = "data/linkedin_state.json"  # Cookies + localStorage snapshot reused by the bot
 
 # REAL CHROME USER AGENT (Crucial to avoid "Headless" detection)
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -62,19 +62,20 @@ def run_login_setup():
             print("\n✅ URL detected: linkedin.com/feed/")
             print("🎉 Login Detected! Saving session...")
             
-            # Small wait to ensure cookies settle
-            time.sleep(3) 
-            
-            # 5. Verification Check
-            if page.locator(".global-nav__me-photo").count() > 0 or page.locator("nav").count() > 0:
-                print("✅ Session Verified: Profile icon found.")
+            # 5. Verification Check (returns on first match, raises on timeout)
+            page.wait_for_selector(".global-nav__me-photo, nav", timeout=5000)
+            print("✅ Session Verified: Profile icon found.")
+
+            # 6. Snapshot cookies/localStorage so the bot can skip the full profile
+            browser.storage_state(path=STATE_FILE)
+            print(f"💾 Session state saved: {Path(STATE_FILE).absolute()}")
             
         except Exception as e:
             print(f"\n❌ Error or Timeout: {e}")
             print("Try running the script again.")
 
         finally:
-            # 6. Close browser to flush cookies to disk
+            # 7. Close browser to flush cookies to disk
             print("💾 Closing browser and writing to disk...")
             browser.close()
             print("✨ DONE. You can now run your bot without logging in again.")
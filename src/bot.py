@@ -4,13 +4,16 @@ Handles all browser automation using Playwright.
 Combines High-Stealth settings with Smart Form Filling logic.
 """
 
-from playwright.sync_api import sync_playwright, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, Page
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Dict
-import time
+from typing import Optional, Dict, List, Tuple, Callable, Awaitable
+import asyncio
+import random
+import re
 
 # Import your configuration and utils
-from src.config import CHROME_USER_DATA, DRY_RUN
+from src.config import LINKEDIN_STATE_FILE, USER_AGENT, DRY_RUN, MAX_CONCURRENT_PAGES, STEALTH_LEVEL
 from src.user_config import PROFILE, ANSWERS
 from src.utils import (
     human_sleep, 
@@ -21,33 +24,248 @@ from src.utils import (
     simulate_reading_pattern
 )
 
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _build_index(mapping: Dict) -> Dict[str, Tuple[str, object]]:
+    """Normalized key ("First Name" -> "first_name") -> (original key, value)."""
+    return {"_".join(_tokens(key)): (key, value) for key, value in mapping.items()}
+
+
+def _build_pattern(index: Dict[str, Tuple[str, object]]) -> "re.Pattern":
+    """
+    One regex alternation over all keys. Keys match anywhere in the label, like a
+    substring check ("relocate" in "willing to relocate?", "phone" in "phone_number");
+    words of a key may be separated by spaces, underscores or punctuation.
+    The regex returns the leftmost match in the label, so the key appearing first
+    wins (not the first key in PROFILE/ANSWERS order); keys are tried longest first
+    only to break ties at the same position (full_name before name).
+    Each key gets its own named group (k_<key>) so a match maps straight back to it.
+    """
+    keys = sorted((key for key in index if key), key=len, reverse=True)
+    if not keys:
+        return re.compile(r"(?!)")  # Never matches
+
+    alternatives = (
+        f"(?P<k_{key}>" + r"[\W_]+".join(map(re.escape, key.split("_"))) + ")"
+        for key in keys
+    )
+    return re.compile("|".join(alternatives))
+
+# Built once at import so each label is matched with one C-level regex scan
+PROFILE_INDEX = _build_index(PROFILE)
+ANSWERS_INDEX = _build_index(ANSWERS)
+PROFILE_RE = _build_pattern(PROFILE_INDEX)
+ANSWERS_RE = _build_pattern(ANSWERS_INDEX)
+
+
+def _lookup(pattern: "re.Pattern", index: Dict[str, Tuple[str, object]], text: str) -> Optional[Tuple[str, object]]:
+    """
+    Find the config entry whose key appears in `text`.
+    """
+    match = pattern.search(text.lower())
+    if not match:
+        return None
+    return index[match.lastgroup[2:]]
+
+
+# Easy Apply button variations. `:visible` lets the browser skip hidden
+# duplicates, so a single query returns the button to click.
+EASY_APPLY_SELECTOR = ", ".join(f"{sel}:visible" for sel in [
+    "button.jobs-apply-button",
+    "button[aria-label*='Easy Apply to']",  # Includes job title - more specific
+    "button[data-control-name*='jobdetails_topcard_inapply']",
+    # Link variants
+    "a[aria-label*='Easy Apply to'][data-view-name='job-apply-button']",
+    # Generic fallbacks
+    "button[aria-label*='Easy Apply']",
+    "a[aria-label*='Easy Apply']",
+])
+
+# Buttons that move the Easy Apply modal forward (Submit / Next / Review)
+FORM_BUTTON_SELECTOR = ", ".join(f"{sel}:visible" for sel in [
+    "button[aria-label='Submit application']",
+    "button[aria-label='Continue to next step']",
+    "button[data-easy-apply-next-button]",
+    "button[aria-label='Next']",
+    "button[data-live-test-easy-apply-review-button]",
+    "button[aria-label='Review your application']",
+    "button[aria-label='Review']",
+])
+# Text-based variants (Playwright-only :has-text) - tried only when the above miss
+FORM_BUTTON_TEXT_SELECTOR = "button:has-text('Next'):visible, button:has-text('Review'):visible"
+
+# The Easy Apply modal, most specific first. Form scanning and button lookups
+# stay inside it so page-level inputs/buttons (e.g. the nav search box) are ignored.
+MODAL_SELECTORS = [".jobs-easy-apply-modal", "[role='dialog']"]
+
+FORM_ERROR_SELECTOR = ".artdeco-inline-feedback__message"
+
+# Anything that means the current form step is ready to act on
+STEP_READY_SELECTOR = ", ".join([
+    FORM_BUTTON_SELECTOR,
+    FORM_BUTTON_TEXT_SELECTOR,
+    f"{FORM_ERROR_SELECTOR}:visible",
+])
+
+# Text of the modal a button lives in - used to detect that a step changed
+MODAL_TEXT_JS = "el => (el.closest('.artdeco-modal') || document.body).innerText"
+
+# True once the clicked button is gone or its modal shows different content
+STEP_CHANGED_JS = """
+([el, before]) => !el.isConnected
+    || !el.offsetParent
+    || (el.closest('.artdeco-modal') || document.body).innerText !== before
+"""
+
+# Reads every form field of the modal in one page.evaluate call. Each element gets
+# a data-bot-* index so Python can target it later without re-querying.
+SCAN_FORM_JS = """
+(modalSelectors) => {
+    const root = modalSelectors.map((sel) => document.querySelector(sel)).find(Boolean);
+    if (!root) {
+        return { inputs: [], fieldsets: [] };
+    }
+
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+
+    const inputs = [...root.querySelectorAll(
+        "input[type='text'], input[type='email'], input[type='tel'], input[type='number']"
+    )].map((el, index) => {
+        el.setAttribute('data-bot-field', index);
+        // <label> first, then the aria-label / placeholder LinkedIn often uses instead
+        const label = (el.labels && el.labels[0] && el.labels[0].innerText)
+            || (el.id && document.querySelector(`label[for="${CSS.escape(el.id)}"]`)?.innerText)
+            || el.getAttribute('aria-label')
+            || el.placeholder
+            || '';
+        return {
+            index,
+            id: el.id,
+            name: el.name,
+            placeholder: el.placeholder,
+            label,
+            value: el.value,
+            visible: isVisible(el),
+        };
+    });
+
+    let optionIndex = 0;
+    const fieldsets = [...root.querySelectorAll('fieldset')].map((fs) => ({
+        text: fs.textContent || '',
+        options: [...fs.querySelectorAll('label')].map((label) => {
+            const index = optionIndex++;
+            label.setAttribute('data-bot-option', index);
+            return { index, text: label.innerText, visible: isVisible(label) };
+        }),
+    }));
+
+    return { inputs, fieldsets };
+}
+"""
+
+# Runs before any page script. Pure JS only - a thrown error here would
+# abort the rest of the cloak on every page load.
+STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+    window.chrome = { runtime: {} };
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+"""
+
+
+class PagePool:
+    """
+    Hands out browser tabs to concurrent workers.
+    At most `max_pages` tabs are in use at once; released tabs are reused.
+    
+    Args:
+        new_page: Coroutine factory that opens a fresh tab (in its own context)
+        max_pages: Maximum number of tabs handed out at the same time
+    """
+
+    def __init__(self, new_page: Callable[[], Awaitable[Page]], max_pages: int = MAX_CONCURRENT_PAGES):
+        self._new_page = new_page
+        self.max_pages = max(1, max_pages)
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._idle: List[Page] = []
+        self._pages: List[Page] = []
+
+    async def acquire(self) -> Page:
+        """Wait for a free slot and return an idle (or brand new) tab."""
+        await self._semaphore.acquire()
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.is_closed():
+                    return page
+            page = await self._new_page()
+            self._pages.append(page)
+            return page
+        except Exception:
+            self._semaphore.release()
+            raise
+
+    def release(self, page: Page):
+        """Give a tab back to the pool so the next worker can reuse it."""
+        if not page.is_closed():
+            self._idle.append(page)
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    async def close(self):
+        # Each tab lives in its own context, so closing the context closes the tab
+        for page in self._pages:
+            try:
+                await page.context.close()
+            except Exception:
+                pass
+        self._pages.clear()
+        self._idle.clear()
+
+
 class JobBot:
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, max_pages: int = MAX_CONCURRENT_PAGES):
         """
         Initialize the bot with browser settings.
+        
+        Args:
+            headless: Run Chrome without a visible window
+            max_pages: How many jobs to work on concurrently (one tab each)
         """
         self.headless = headless
-        self.profile_dir = Path(CHROME_USER_DATA)
+        self.max_pages = max_pages
+        self.state_file = Path(LINKEDIN_STATE_FILE)
         self.playwright = None
-        self.browser: Optional[BrowserContext] = None
+        self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
-        # Create profile dir if missing
-        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        self.pool: Optional[PagePool] = None
         print(f"🤖 Bot initialized (Headless: {headless})")
 
-    def start_browser(self):
+    async def start_browser(self):
         """
         Launch the browser with MAXIMUM anti-detection settings.
+        One Chrome process is shared; every tab gets a light context
+        restored from the saved LinkedIn session (storage state).
         """
         print("🚀 Launching Stealth Browser...")
-        self.playwright = sync_playwright().start()
+        self.playwright = await async_playwright().start()
         
         # 1. Launch with specific arguments to hide automation
-        self.browser = self.playwright.chromium.launch_persistent_context(
-            user_data_dir=str(self.profile_dir),
+        self.browser = await self.playwright.chromium.launch(
             channel="chrome",       # Uses your real Chrome
             headless=self.headless,
-            viewport={'width': 1920, 'height': 1080},
             args=[
                 '--disable-blink-features=AutomationControlled', # CRITICAL: Hides "controlled by automated software"
                 '--start-maximized',
@@ -57,103 +275,150 @@ class JobBot:
                 '--disable-dev-shm-usage',
                 '--disable-web-security',
                 '--disable-features=IsolateOrigins,site-per-process',
+                '--blink-settings=imagesEnabled=false',  # Bot never looks at images - skip downloading them
             ]
         )
+
+        if not self.state_file.exists():
+            print(f"⚠️ No saved session at {self.state_file} - run setup_login.py first (continuing logged out)")
+
+        # 2. Get the main page (used for searching) and the worker tab pool
+        self.page = await self._new_page()
+        self.pool = PagePool(self._new_page, max_pages=self.max_pages)
         
-        # 2. Get the page
-        self.page = self.browser.pages[0] if self.browser.pages else self.browser.new_page()
-
-        # 3. Inject JavaScript to fake "navigator" properties (The Cloak)
-        self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            window.chrome = { runtime: {} };
-            human_sleep(0.7, 1.5)
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-        """)
+        print(f"✅ Stealth Browser Ready ({self.pool.max_pages} parallel tabs)")
+
+    async def _new_page(self) -> Page:
+        """
+        Open a tab in a fresh context that reuses the saved LinkedIn session.
+        """
+        context = await self.browser.new_context(
+            storage_state=str(self.state_file) if self.state_file.exists() else None,
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=USER_AGENT,
+        )
+
+        # Inject JavaScript to fake "navigator" properties (The Cloak)
+        await context.add_init_script(STEALTH_JS)
+
+        return await context.new_page()
+
+    async def apply_to_jobs(self, jobs: List[Tuple[str, str]]) -> List[str]:
+        """
+        Apply to many jobs concurrently.
         
-        print("✅ Stealth Browser Ready")
+        Args:
+            jobs: List of (job_url, resume_path) pairs
+            
+        Returns:
+            One result string per job, in the same order
+        """
+        if not self.pool:
+            await self.start_browser()
+
+        results = await asyncio.gather(
+            *[self.apply_to_job(url, resume_path) for url, resume_path in jobs],
+            return_exceptions=True
+        )
+        return [f"Failed: {r}" if isinstance(r, BaseException) else r for r in results]
 
-    def apply_to_job(self, job_url, resume_path):
+    async def apply_to_job(self, job_url, resume_path):
         """
-        The main logic loop to apply for a single job.
+        Apply to a single job in its own tab from the pool.
         """
-        if not self.page:
-            self.start_browser()
+        if not self.pool:
+            await self.start_browser()
+
+        async with self.pool.page() as page:
+            return await self._apply_on_page(page, job_url, resume_path)
 
+    async def _apply_on_page(self, page: Page, job_url, resume_path):
+        """
+        The main logic loop to apply for a single job.
+        """
         print(f"\n🔗 Navigating to: {job_url}")
         try:
-            self.page.goto(job_url, timeout=60000)
-            human_sleep(1, 2) # Let page load
-
-            # 1. Simulate Reading (Important for stealth)
-            simulate_reading_pattern(self.page, "h1")
-            # We look for multiple variations of the button
-            apply_locators = [
-                # Most specific first (single button match)
-                "button.jobs-apply-button",
-                "button[aria-label*='Easy Apply to']",  # Includes job title - more specific
-                "button[data-control-name*='jobdetails_topcard_inapply']",
-                # Link variants
-                "a[aria-label*='Easy Apply to'][data-view-name='job-apply-button']",
-                # Generic fallbacks
-                "button[aria-label*='Easy Apply']",
-                "a[aria-label*='Easy Apply']",
-            ]
-            
-            clicked = False
-            for selector in apply_locators:
-                try:
-                    loc = self.page.locator(selector)
-                    count = loc.count()
-                    if count > 0:
-                        # Find the first VISIBLE element
-                        for i in range(count):
-                            elem = loc.nth(i)
-                            if elem.is_visible():
-                                print(f"👇 Clicking Easy Apply... (found at index {i})")
-                                elem.click()
-                                clicked = True
-                                break
-                        if clicked:
-                            break
-                except Exception as e:
-                    continue
-
-            if not clicked:
+            await page.goto(job_url, timeout=60000)
+
+            # 1. Simulate Reading (Important for stealth - see STEALTH_LEVEL)
+            if STEALTH_LEVEL >= 1:
+                await human_sleep(1, 2)
+            if STEALTH_LEVEL >= 2:
+                await simulate_reading_pattern(page, "h1")
+            # 2. Click Easy Apply - one query for all button variations
+            easy_apply = page.locator(EASY_APPLY_SELECTOR).first
+            try:
+                await easy_apply.wait_for(state="visible", timeout=5000)
+            except Exception:
                 print("⚠️ No 'Easy Apply' button found (Might be external or already applied). Skipping.")
                 return "Skipped"
 
-            human_sleep(0.5, 1)
+            print("👇 Clicking Easy Apply...")
+            await easy_apply.click()
 
             # 3. The Form Loop (Handle Popups)
             # We loop up to 10 times to handle multi-page forms (Contact -> Resume -> Review -> Submit)
             max_steps = 10
             for step in range(max_steps):
                 print(f"   ➡️ Form Step {step + 1}")
+
+                # Buttons/errors are looked up inside the modal only - the job page
+                # behind it has its own (hidden or unrelated) buttons
+                modal = await self._easy_apply_modal(page)
+
+                # Wait until the step's button (or an error) shows up instead of sleeping
+                try:
+                    await modal.locator(STEP_READY_SELECTOR).first.wait_for(state="visible", timeout=10000)
+                except Exception:
+                    pass  # Reported below as "Stuck"
                 
                 # Scroll within the modal to load all fields
                 try:
-                    modal = self.page.locator(".jobs-easy-apply-content")
-                    if modal.count() > 0:
-                        modal.first.evaluate("el => el.scrollBy(0, el.scrollHeight / 2)")
-                        human_sleep(0.2, 0.4)
+                    content = modal.locator(".jobs-easy-apply-content")
+                    if await content.count() > 0:
+                        await content.first.evaluate("el => el.scrollBy(0, el.scrollHeight / 2)")
+                        await human_sleep(0.2, 0.4)
                 except:
                     pass
                 
                 # A. Auto-Fill inputs
-                self._fill_smart_fields()
+                await self._fill_smart_fields(page)
 
                 # B. Upload Resume if asked
-                self._handle_upload(resume_path)
+                await self._handle_upload(page, resume_path)
 
-                # C. Check for SUBMIT
-                submit_btn = self.page.locator("button[aria-label='Submit application']")
-                if submit_btn.is_visible():
+                # C. Find the SUBMIT / NEXT / REVIEW button in one query
+                button = modal.locator(FORM_BUTTON_SELECTOR).first
+                if not await button.is_visible():
+                    button = modal.locator(FORM_BUTTON_TEXT_SELECTOR).first
+
+                if not await button.is_visible():
+                    # Check for errors
+                    if await modal.locator(FORM_ERROR_SELECTOR).first.is_visible():
+                        print("❌ Form Error: Missing required field.")
+                        return "Failed (Form Error)"
+                    
+                    # Debug: show what buttons are visible
+                    print("⚠️ Stuck: No Next/Submit/Review button found.")
+                    print("   🔍 Debugging - checking all visible buttons:")
+                    try:
+                        all_buttons = await modal.locator("button[aria-label]").all()
+                        for i, btn in enumerate(all_buttons[:8]):
+                            if await btn.is_visible():
+                                label = await btn.get_attribute("aria-label") or "no-label"
+                                print(f"      {i+1}. {label[:60]}")
+                    except:
+                        pass
+                    return "Failed (Stuck)"
+
+                label = await button.evaluate("el => (el.getAttribute('aria-label') || el.innerText || '').toLowerCase()")
+
+                if "submit" in label:
                     print("✅ Found Submit button!")
                     if not DRY_RUN:
                         try:
-                            human_click(self.page, "button[aria-label='Submit application']")
-                            human_sleep(1, 2) # Wait for submission
+                            await human_click(page, button)
+                            await human_sleep(1, 2) # Wait for submission
                             print("   ✅ Submit clicked")
                         except Exception as e:
                             print("   ❌ Submit click failed:", e)
@@ -162,138 +427,121 @@ class JobBot:
                         print("   (DRY RUN: Submit skipped)")
                     return "Success"
 
-                # D. Check for NEXT or REVIEW
-                # Try multiple Next button selectors
-                next_selectors = [
-                    "button[aria-label='Continue to next step']",
-                    "button[data-easy-apply-next-button]",
-                    "button:has-text('Next')",
-                    "button[aria-label='Next']",
-                ]
-                review_selectors = [
-                    "button[data-live-test-easy-apply-review-button]",
-                    "button[aria-label='Review your application']",
-                    "button[aria-label='Review']",
-                    "button:has-text('Review')",
-                ]
-
-                next_clicked = False
-                for selector in next_selectors:
-                    try:
-                        loc = self.page.locator(selector)
-                        if loc.count() > 0 and loc.first.is_visible():
-                            human_click(self.page, selector)
-                            print("➡️ Clicked Next")
-                            next_clicked = True
-                            break
-                    except Exception:
-                        continue
-
-                if next_clicked:
-                    pass  # Already clicked, continue to next iteration
+                if "review" in label:
+                    # Scroll button into view first
+                    await button.scroll_into_view_if_needed()
+                    await human_sleep(0.2, 0.3)
+                    await self._click_and_wait_for_step(page, button)
+                    print("👀 Clicked Review")
                 else:
-                    # Try Review button
-                    review_clicked = False
-                    for selector in review_selectors:
-                        try:
-                            loc = self.page.locator(selector)
-                            if loc.count() > 0 and loc.first.is_visible():
-                                # Scroll button into view first
-                                loc.first.scroll_into_view_if_needed()
-                                human_sleep(0.2, 0.3)
-                                human_click(self.page, selector)
-                                print("👀 Clicked Review")
-                                review_clicked = True
-                                break
-                        except Exception as e:
-                            continue
-                    
-                    if not review_clicked:
-                        # Check for errors
-                        if self.page.locator(".artdeco-inline-feedback__message").is_visible():
-                            print("❌ Form Error: Missing required field.")
-                            return "Failed (Form Error)"
-                        
-                        # Debug: show what buttons are visible
-                        print("⚠️ Stuck: No Next/Submit/Review button found.")
-                        print("   🔍 Debugging - checking all visible buttons:")
-                        try:
-                            all_buttons = self.page.locator("button[aria-label]").all()
-                            for i, btn in enumerate(all_buttons[:8]):
-                                if btn.is_visible():
-                                    label = btn.get_attribute("aria-label") or "no-label"
-                                    print(f"      {i+1}. {label[:60]}")
-                        except:
-                            pass
-                        return "Failed (Stuck)"
-                
-                human_sleep(0.3, 0.6)
+                    await self._click_and_wait_for_step(page, button)
+                    print("➡️ Clicked Next")
 
+                # LinkedIn flags missing required fields after Next/Review
+                if await modal.locator(f"{FORM_ERROR_SELECTOR}:visible").first.is_visible():
+                    print("❌ Form Error: Missing required field.")
+                    return "Failed (Form Error)"
+
+            # Only reached when every step advanced without a Submit button
+            print(f"⚠️ Gave up after {max_steps} form steps without reaching Submit.")
             return "Failed (Too many steps)"
         except Exception as e:
             print(f"❌ Error applying: {e}")
             return f"Failed: {str(e)}"
 
-    def _fill_smart_fields(self):
+    async def _easy_apply_modal(self, page: Page):
+        """
+        Locator for the open Easy Apply modal (same preference order as SCAN_FORM_JS).
+        """
+        for selector in MODAL_SELECTORS:
+            modal = page.locator(selector).first
+            if await modal.count() > 0:
+                return modal
+        return page.locator(MODAL_SELECTORS[0]).first
+
+    async def _click_and_wait_for_step(self, page: Page, button):
+        """
+        Click a Next/Review button and return as soon as the modal changes,
+        plus a short random pause so steps don't fire at machine speed.
+        """
+        handle = await button.element_handle()
+        try:
+            before = await handle.evaluate(MODAL_TEXT_JS)
+            await human_click(page, button, pause_after=False)
+            try:
+                await page.wait_for_function(STEP_CHANGED_JS, arg=[handle, before], timeout=10000)
+            except Exception:
+                pass  # Next step's wait decides what happens
+        finally:
+            # Release the JS reference so old step buttons can be garbage collected
+            await handle.dispose()
+        await asyncio.sleep(random.uniform(0.3, 0.8))
+
+    async def _fill_smart_fields(self, page: Page):
         """
         Scans the page for inputs and fills them using USER_CONFIG.
         Tracks unfilled fields for later review.
         """
         unfilled_fields = []
+        touched = False
         
         try:
+            # One round-trip: read every input / fieldset, then match locally
+            scan = await page.evaluate(SCAN_FORM_JS, MODAL_SELECTORS)
+
             # 1. Text Inputs
-            inputs = self.page.locator("input[type='text'], input[type='email'], input[type='tel'], input[type='number']")
-            count = inputs.count()
-            
-            for i in range(count):
-                field = inputs.nth(i)
-                if field.is_visible() and not field.get_attribute("value"):
-                    label = self._get_label(field).lower()
+            for field in scan["inputs"]:
+                if field["visible"] and not field["value"]:
+                    label = field["label"].lower()
                     
                     # Match logic
-                    matched = False
-                    for key, value in PROFILE.items():
-                        if key in label:
-                            print(f"      ✍️ Filling {key}...")
-                            field.fill(str(value))
-                            human_sleep(0.2, 0.4)
-                            matched = True
-                            break
-                    
-                    if not matched and label:
+                    hit = _lookup(PROFILE_RE, PROFILE_INDEX, label)
+                    if hit:
+                        key, value = hit
+                        print(f"      ✍️ Filling {key}...")
+                        # Keystrokes are paced in the browser, so typing itself looks human
+                        await page.locator(f"[data-bot-field='{field['index']}']").press_sequentially(
+                            str(value), delay=random.randint(40, 90)
+                        )
+                        touched = True
+                    elif label:
                         unfilled_fields.append(label)
                         print(f"      ⚠️ Skipped unfilled field: {label}")
 
             # 2. Radio Buttons (Yes/No)
-            fieldsets = self.page.locator("fieldset")
-            for i in range(fieldsets.count()):
-                group = fieldsets.nth(i)
-                text = group.text_content().lower()
+            for group in scan["fieldsets"]:
+                text = group["text"].lower()
                 
                 matched = False
-                for question, answer in ANSWERS.items():
-                    if question in text:
-                        # Try to click the specific radio (label containing 'Yes' or 'No')
-                        option = group.locator(f"label:has-text('{answer}')")
-                        if option.is_visible():
-                            option.click()
-                            human_sleep(0.2, 0.4)
-                            matched = True
-                            break
+                hit = _lookup(ANSWERS_RE, ANSWERS_INDEX, text)
+                if hit:
+                    answer = str(hit[1])
+                    # Try to click the specific radio (label containing 'Yes' or 'No')
+                    option = next(
+                        (o for o in group["options"] if o["visible"] and answer.lower() in o["text"].lower()),
+                        None
+                    )
+                    if option:
+                        await page.locator(f"[data-bot-option='{option['index']}']").click()
+                        touched = True
+                        matched = True
                 
                 if not matched and text.strip():
                     unfilled_fields.append(f"Radio: {text[:100]}")
                     print(f"      ⚠️ Skipped unfilled radio: {text[:100]}")
+
+            # One human-like pause for the whole page instead of one per field
+            if touched:
+                await asyncio.sleep(random.uniform(0.8, 1.6))
             
             # Save unfilled fields if any
             if unfilled_fields:
-                self._log_unfilled_fields(unfilled_fields)
+                self._log_unfilled_fields(page, unfilled_fields)
         
-        except Exception:
-            pass
+        except Exception as e:
+            print(f"      ⚠️ Smart fill failed: {e}")
     
-    def _log_unfilled_fields(self, fields: list):
+    def _log_unfilled_fields(self, page: Page, fields: list):
         """Log unfilled fields to an Excel error tracker."""
         import pandas as pd
         from pathlib import Path
@@ -307,7 +555,7 @@ class JobBot:
             data = {
                 "Timestamp": [timestamp] * len(fields),
                 "Unfilled Field": fields,
-                "Job URL": [self.page.url] * len(fields),
+                "Job URL": [page.url] * len(fields),
             }
             
             df = pd.DataFrame(data)
@@ -322,35 +570,35 @@ class JobBot:
         except Exception as e:
             print(f"      ⚠️ Could not log unfilled fields: {e}") 
 
-    def _get_label(self, element):
-        """Helper to get label text for an input."""
-        try:
-            id_val = element.get_attribute("id")
-            if id_val:
-                return self.page.locator(f"label[for='{id_val}']").inner_text()
-        except:
-            return ""
-        return ""
-
-    def _handle_upload(self, resume_path):
+    async def _handle_upload(self, page: Page, resume_path):
         """Finds file inputs and uploads resume - ALWAYS replaces LinkedIn's stored resume."""
         try:
-            file_input = self.page.locator("input[type='file']")
-            if file_input.count() > 0:
+            file_input = page.locator("input[type='file']")
+            if await file_input.count() > 0:
                 # ALWAYS upload our resume, even if LinkedIn has one pre-filled
                 print(f"      📎 Uploading resume: {resume_path}")
-                file_input.first.set_input_files(resume_path)
-                human_sleep(0.5, 1)
+                await file_input.first.set_input_files(resume_path)
+                await human_sleep(0.5, 1)
                 print(f"      ✅ Resume uploaded successfully")
         except Exception as e:
             print(f"      ⚠️ Resume upload skipped: {e}")
 
-    def close(self):
+    async def close(self):
+        try:
+            if getattr(self, 'pool', None):
+                await self.pool.close()
+        except Exception:
+            pass
+        try:
+            if getattr(self, 'page', None):
+                await self.page.context.close()
+        except Exception:
+            pass
         try:
-            # close persistent context / browser
+            # close the shared browser process
             if getattr(self, 'browser', None):
                 try:
-                    self.browser.close()
+                    await self.browser.close()
                 except Exception:
                     pass
         except Exception:
@@ -358,7 +606,7 @@ class JobBot:
         try:
             if getattr(self, 'playwright', None):
                 try:
-                    self.playwright.stop()
+                    await self.playwright.stop()
                 except Exception:
                     pass
         except Exception:
@@ -366,6 +614,10 @@ class JobBot:
 
 # TEST
 if __name__ == "__main__":
-    bot = JobBot(headless=False)
-    bot.start_browser()
-    # bot.apply_to_job("https://linkedin.com/jobs/view/...", "data/resumes/frontend.pdf")
\ No newline at end of file
+    async def _demo():
+        bot = JobBot(headless=False)
+        await bot.start_browser()
+        # await bot.apply_to_jobs([("https://linkedin.com/jobs/view/...", "data/resumes/frontend.pdf")])
+        await bot.close()
+
+    asyncio.run(_demo())
\ No newline at end of file
@@ -22,6 +22,7 @@ ROOT_DIR = os.path.dirname(SRC_DIR)
 DATA_DIR = os.path.join(ROOT_DIR, "data")
 RESUMES_DIR = os.path.join(DATA_DIR, "resumes")
 CHROME_USER_DATA = os.path.join(DATA_DIR, "chrome_profile")
+LINKEDIN_STATE_FILE = os.path.join(DATA_DIR, "linkedin_state.json")  # Saved by setup_login.py
 LOGS_DIR = os.path.join(DATA_DIR, "logs")
 HISTORY_FILE = os.path.join(DATA_DIR, "history.json")
 
@@ -34,11 +35,24 @@ os.makedirs(LOGS_DIR, exist_ok=True)
 # HEADLESS_MODE: when False the browser will be visible for debugging
 DRY_RUN = os.getenv("DRY_RUN", "False").lower() in ("1", "true", "yes")
 HEADLESS_MODE = os.getenv("HEADLESS_MODE", "False").lower() in ("1", "true", "yes")
+# Browser identity used for every bot context (matches setup_login.py)
+USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+# STEALTH_LEVEL: 2 = read the page like a human, 1 = short pauses only, 0 = no extra delays
+# (defaults to 0 for DRY_RUN so test runs go fast)
+try:
+    STEALTH_LEVEL = int(os.getenv("STEALTH_LEVEL", "0" if DRY_RUN else "2"))
+except Exception:
+    STEALTH_LEVEL = 2
 # Daily/application settings (can be tuned via environment)
 try:
     MAX_APPLICATIONS_PER_DAY = int(os.getenv("MAX_APPLICATIONS_PER_DAY", "40"))
 except Exception:
     MAX_APPLICATIONS_PER_DAY = 20
+# How many job tabs the bot works on at the same time (one shared browser)
+try:
+    MAX_CONCURRENT_PAGES = int(os.getenv("MAX_CONCURRENT_PAGES", "3"))
+except Exception:
+    MAX_CONCURRENT_PAGES = 3
 
 # Comma-separated search queries / preferred locations
 SEARCH_QUERIES = [q.strip() for q in os.getenv("SEARCH_QUERIES", "Full Stack Intern,Frontend Intern,Web Developer Intern,React Developer Intern,Node.js Intern").split(",") if q.strip()]
@@ -5,22 +5,59 @@ This is the "brain" of the bot that decides which resume to use.
 """
 
 import os
+import re
 import json
+import time
+import hashlib
+from pathlib import Path
 from typing import Dict, Optional, List
+import msgspec
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from src.resume_manager import parse_resumes
+
 # Load environment variables
 load_dotenv()
 
+# Leading ~800 words of a resume; a linear scan instead of splitting the whole text
+RESUME_SUMMARY_RE = re.compile(r'\s*(?:\S+\s*){0,800}')
+
+# On-disk response cache: entries expire after a week, least recently used evicted first
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+CACHE_MAX_ENTRIES = 500
+
+
+class MatchResult(msgspec.Struct):
+    """One resume selection as returned by Gemini."""
+    selected_resume: str
+    confidence: float
+    reasoning: str
+    match_score: float
+    key_matches: List[str] = []
+
+
+class BatchMatchResult(MatchResult, kw_only=True):
+    """A selection inside a batch response, tagged with its job number."""
+    job_index: int
+
 
 class LLMEngine:
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_file: str = "data/llm_cache.json",
+        warmup: bool = True,
+        resumes: Optional[Dict[str, Dict]] = None
+    ):
         """
         Initialize the LLM engine with Gemini.
         
         Args:
             api_key: Google AI API key (or uses GEMINI_API_KEY from .env)
+            cache_file: JSON file where Gemini answers are cached between runs
+            warmup: Open the connection now so the first real call skips the handshake
+            resumes: Resume data from ResumeManager to pre-build the prompt prefix for
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         
@@ -31,15 +68,63 @@ class LLMEngine:
                 "   2. Add to .env file: GEMINI_API_KEY=your_key_here"
             )
         
-        # Configure Gemini
-        genai.configure(api_key=self.api_key)
+        # Configure Gemini (gRPC keeps one multiplexed connection open for all calls)
+        genai.configure(api_key=self.api_key, transport="grpc")
         
         # Use Gemini 1.5 Flash (fast and cheap, perfect for this task)
-        self.model = genai.GenerativeModel('gemini-flash-latest')
+        # JSON mime type makes Gemini return bare JSON (no markdown fences)
+        self.model = genai.GenerativeModel(
+            'gemini-flash-latest',
+            generation_config={"response_mime_type": "application/json"}
+        )
+        
+        # Truncated resume texts, keyed by (filename, mtime, text length)
+        self._summary_cache: Dict[tuple, str] = {}
+        
+        # Static prompt prefix (instructions + resumes), keyed by resume set hash
+        self._resume_prefix_cache: Dict[str, str] = {}
+        
+        # Gemini answers from previous runs (re-posted jobs are common)
+        self.cache_file = Path(cache_file)
+        self._response_cache: Dict[str, Dict] = self._load_response_cache()
+        
+        if resumes:
+            self._resume_prefix(resumes)
+        
+        if warmup:
+            self._warmup()
         
         print("LLM Engine initialized (Gemini 2.0 Flash)")
     
     
+    def preload_resumes(self, paths: List[str]) -> Dict[str, Dict]:
+        """
+        Parse resume PDFs in parallel and pre-build their prompt summaries,
+        so the first job's LLM call pays no preprocessing cost.
+        
+        Args:
+            paths: Resume PDF file paths
+            
+        Returns:
+            Dictionary of {filename: resume_data} (same shape as ResumeManager)
+        """
+        resumes = parse_resumes(paths)
+        if resumes:
+            # Fills self._summary_cache for every resume as a side effect
+            self._resume_prefix(resumes)
+        return resumes
+    
+    
+    def _warmup(self):
+        """
+        Send a 1-token request so TLS / channel setup happens before the first job.
+        """
+        try:
+            self.model.generate_content("ping", generation_config={"max_output_tokens": 1})
+        except Exception as e:
+            print(f"⚠️ Gemini warmup failed (will connect on first call): {e}")
+    
+    
     def select_best_resume(
         self, 
         job_description: str, 
@@ -65,6 +150,13 @@ class LLMEngine:
         if not resumes:
             raise ValueError("❌ No resumes available for matching!")
         
+        cache_key = self._cache_key("match", self._resume_set_key(resumes), job_title or "", job_description[:3000])
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print(f"♻️ Cached selection: {cached['selected_resume']}")
+            self._save_response_cache()  # Persist the refreshed used_at (LRU order)
+            return cached
+        
         # Build the prompt
         prompt = self._build_matching_prompt(job_description, resumes, job_title)
         
@@ -81,6 +173,10 @@ class LLMEngine:
             print(f" Selected: {result['selected_resume']} "
                   f"(Confidence: {result['confidence']:.0%})")
             
+            if not result.get('fallback'):
+                self._cache_put(cache_key, result)
+                self._save_response_cache()
+            
             return result
             
         except Exception as e:
@@ -89,6 +185,216 @@ class LLMEngine:
             return self._fallback_selection(resumes)
     
     
+    def select_best_resume_batch(
+        self,
+        job_descriptions: List[str],
+        resumes: Dict[str, Dict],
+        job_titles: Optional[List[Optional[str]]] = None,
+        batch_size: int = 10
+    ) -> List[Dict]:
+        """
+        Select the best resume for many jobs with one Gemini call per batch.
+        
+        Args:
+            job_descriptions: Job posting texts
+            resumes: Dictionary of resume data from ResumeManager
+            job_titles: Optional job titles (same order as job_descriptions)
+            batch_size: Max jobs packed into a single prompt
+            
+        Returns:
+            One result per job (same shape as select_best_resume), in order
+        """
+        if not resumes:
+            raise ValueError("❌ No resumes available for matching!")
+        
+        titles = job_titles or [None] * len(job_descriptions)
+        resume_key = self._resume_set_key(resumes)
+        keys = [
+            self._cache_key("match", resume_key, title or "", description[:3000])
+            for description, title in zip(job_descriptions, titles)
+        ]
+        
+        # Only jobs we haven't seen before go to Gemini
+        results: List[Optional[Dict]] = [self._cache_get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < len(keys):
+            print(f"♻️ {len(keys) - len(pending)} selections served from cache")
+        
+        for start in range(0, len(pending), batch_size):
+            indexes = pending[start:start + batch_size]
+            chunk = [job_descriptions[i] for i in indexes]
+            chunk_titles = [titles[i] for i in indexes]
+            prompt = self._build_batch_prompt(chunk, resumes, chunk_titles)
+            
+            try:
+                print(f"Analyzing {len(chunk)} job descriptions with Gemini...")
+                response = self.model.generate_content(prompt)
+                chunk_results = self._parse_batch_response(response.text.strip(), resumes, len(chunk))
+            except Exception as e:
+                print(f"⚠️ LLM error: {e}")
+                chunk_results = [self._fallback_selection(resumes) for _ in chunk]
+            
+            for i, result in zip(indexes, chunk_results):
+                results[i] = result
+                if not result.get('fallback'):
+                    self._cache_put(keys[i], result)
+        
+        if keys:
+            # Also after cache-only runs, so refreshed used_at times reach disk
+            self._save_response_cache()
+        
+        return results
+    
+    
+    def _load_response_cache(self) -> Dict[str, Dict]:
+        """
+        Load cached Gemini answers, dropping expired entries.
+        """
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            now = time.time()
+            return {
+                key: entry for key, entry in entries.items()
+                if now - entry['saved_at'] < CACHE_TTL_SECONDS
+            }
+        except Exception as e:
+            print(f"⚠️ LLM cache corrupted, starting fresh: {e}")
+            return {}
+    
+    
+    def _save_response_cache(self):
+        """
+        Write cached Gemini answers to disk.
+        """
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._response_cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠️ Could not save LLM cache: {e}")
+    
+    
+    def _cache_key(self, *parts: str) -> str:
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+    
+    
+    def _resume_set_key(self, resumes: Dict[str, Dict]) -> str:
+        """
+        Hash of the resume filenames and versions - changes when any resume does.
+        """
+        return self._cache_key(*(
+            f"{filename}:{resumes[filename].get('mtime', 0)}:{len(resumes[filename]['text'])}"
+            for filename in sorted(resumes)
+        ))
+    
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry['saved_at'] >= CACHE_TTL_SECONDS:
+            del self._response_cache[key]
+            return None
+        entry['used_at'] = time.time()
+        return dict(entry['result'])
+    
+    
+    def _cache_put(self, key: str, result: Dict):
+        now = time.time()
+        self._response_cache[key] = {'saved_at': now, 'used_at': now, 'result': result}
+        
+        # Evict least recently used entries beyond the size cap
+        overflow = len(self._response_cache) - CACHE_MAX_ENTRIES
+        if overflow > 0:
+            oldest = sorted(self._response_cache, key=lambda k: self._response_cache[k]['used_at'])
+            for stale_key in oldest[:overflow]:
+                del self._response_cache[stale_key]
+    
+    
+    def _resume_summary(self, filename: str, data: Dict) -> str:
+        """
+        First 800 words of a resume, computed once per file version.
+        """
+        key = (filename, data.get('mtime'), len(data['text']))
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            words = RESUME_SUMMARY_RE.match(data['text']).group().split()  # Limit context size
+            summary = ' '.join(words)
+            self._summary_cache[key] = summary
+        return summary
+    
+    
+    def _resume_prefix(self, resumes: Dict[str, Dict]) -> str:
+        """
+        Static start of every matching prompt: instructions + all resumes.
+        Built once per resume set; keeping it byte-identical across calls
+        lets Gemini's implicit prefix caching reuse it.
+        """
+        key = self._resume_set_key(resumes)
+        
+        if key not in self._resume_prefix_cache:
+            blocks = "\n\n".join(
+                f"=== {filename} ===\n{self._resume_summary(filename, data)}"
+                for filename, data in resumes.items()
+            )
+            self._resume_prefix_cache[key] = (
+                "You are an expert resume matcher for job applications. "
+                "Your task is to analyze the job description(s) below and select the BEST resume "
+                "for each one from the available options.\n\n"
+                f"Available Resumes:\n\n{blocks}\n\n"
+            )
+        
+        return self._resume_prefix_cache[key]
+    
+    
+    def _build_batch_prompt(
+        self,
+        job_descriptions: List[str],
+        resumes: Dict[str, Dict],
+        job_titles: List[Optional[str]]
+    ) -> str:
+        """
+        Construct one prompt that matches several jobs against the same resumes.
+        """
+        jobs_text = ""
+        for i, (description, title) in enumerate(zip(job_descriptions, job_titles)):
+            job_context = f"Job Title: {title}\n" if title else ""
+            jobs_text += f"\n=== JOB {i} ===\n{job_context}{description[:3000]}\n"
+        
+        return self._resume_prefix(resumes) + f"""Job Descriptions:
+{jobs_text}
+TASK:
+For every job, select the resume that is the BEST match. Consider:
+1. Technical skills alignment (frameworks, languages, tools)
+2. Experience level match (junior/mid/senior)
+3. Domain expertise (frontend/backend/fullstack/devops/etc.)
+4. Relevant projects or achievements
+
+RESPOND ONLY WITH A JSON ARRAY, one object per job:
+[
+  {{
+    "job_index": 0,
+    "selected_resume": "exact_filename.pdf",
+    "confidence": 0.85,
+    "reasoning": "Brief 1-2 sentence explanation of why this resume is best",
+    "match_score": 85,
+    "key_matches": ["React", "TypeScript", "5+ years experience"]
+  }}
+]
+
+Rules:
+- Return exactly {len(job_descriptions)} objects, job_index 0 to {len(job_descriptions) - 1}
+- selected_resume MUST be one of the exact filenames provided
+- confidence: 0.0 to 1.0 (decimal)
+- match_score: 0 to 100 (integer)
+- Be decisive - always pick ONE resume per job, even if none are perfect
+- If multiple resumes are equally good, pick the most specialized one
+"""
+    
+    
     def _build_matching_prompt(
         self, 
         job_description: str, 
@@ -97,31 +403,15 @@ class LLMEngine:
     ) -> str:
         """
         Construct the prompt for Gemini to analyze and match.
+        Only the job part changes between calls; the resume prefix is cached.
         """
-        # Prepare resume summaries (first 800 words of each)
-        resume_summaries = {}
-        for filename, data in resumes.items():
-            text = data['text']
-            words = text.split()[:800]  # Limit context size
-            resume_summaries[filename] = ' '.join(words)
-        
         job_context = f"Job Title: {job_title}\n\n" if job_title else ""
         
-        prompt = f"""You are an expert resume matcher for job applications. Your task is to analyze a job description and select the BEST resume from the available options.
-
-{job_context}Job Description:
+        return self._resume_prefix(resumes) + f"""{job_context}Job Description:
 ---
-{job_description[:3000]}  
+{job_description[:3000]}
 ---
 
-Available Resumes:
-"""
-        
-        for filename, text in resume_summaries.items():
-            prompt += f"\n\n=== {filename} ===\n{text}\n"
-        
-        prompt += """
-
 TASK:
 Analyze the job requirements and select the resume that is the BEST match. Consider:
 1. Technical skills alignment (frameworks, languages, tools)
@@ -130,13 +420,13 @@ Analyze the job requirements and select the resume that is the BEST match. Consi
 4. Relevant projects or achievements
 
 RESPOND ONLY IN THIS EXACT JSON FORMAT (no markdown, no explanation outside JSON):
-{
+{{
   "selected_resume": "exact_filename.pdf",
   "confidence": 0.85,
   "reasoning": "Brief 1-2 sentence explanation of why this resume is best",
   "match_score": 85,
   "key_matches": ["React", "TypeScript", "5+ years experience"]
-}
+}}
 
 Rules:
 - selected_resume MUST be one of the exact filenames provided
@@ -145,8 +435,6 @@ Rules:
 - Be decisive - always pick ONE resume, even if none are perfect
 - If multiple resumes are equally good, pick the most specialized one
 """
-        
-        return prompt
     
     
     def _parse_llm_response(self, response_text: str, resumes: Dict) -> Dict:
@@ -154,44 +442,14 @@ Rules:
         Parse and validate the LLM's JSON response.
         """
         try:
-            # Remove markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
-            
-            # Parse JSON
-            result = json.loads(response_text.strip())
-            
-            # Validate required fields
-            required_fields = ['selected_resume', 'confidence', 'reasoning', 'match_score']
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Validate selected resume exists
-            if result['selected_resume'] not in resumes:
-                # Try to find closest match (case-insensitive)
-                selected_lower = result['selected_resume'].lower()
-                for filename in resumes.keys():
-                    if filename.lower() == selected_lower:
-                        result['selected_resume'] = filename
-                        break
-                else:
-                    raise ValueError(f"Invalid resume: {result['selected_resume']}")
-            
-            # Normalize confidence to 0-1 range
-            confidence = float(result['confidence'])
-            if confidence > 1.0:
-                confidence = confidence / 100.0
-            result['confidence'] = max(0.0, min(1.0, confidence))
+            # Parse + type-check in one pass (strict=False also takes "0.7" for a float)
+            match = msgspec.json.decode(response_text.strip(), type=MatchResult, strict=False)
+            return self._validate_match(match, resumes)
             
-            # Validate match_score
-            result['match_score'] = max(0, min(100, int(result['match_score'])))
-            
-            return result
-            
-        except json.JSONDecodeError as e:
+        except msgspec.ValidationError as e:
+            print(f"⚠️ Error validating LLM response: {e}")
+            return self._fallback_selection(resumes)
+        except msgspec.DecodeError as e:
             print(f"⚠️ Failed to parse LLM JSON response: {e}")
             print(f"   Raw response: {response_text[:200]}...")
             return self._fallback_selection(resumes)
@@ -200,6 +458,62 @@ Rules:
             return self._fallback_selection(resumes)
     
     
+    def _parse_batch_response(self, response_text: str, resumes: Dict, count: int) -> List[Dict]:
+        """
+        Parse a JSON array of selections; jobs missing from it get the fallback.
+        """
+        try:
+            # Items stay raw so one malformed entry doesn't sink the whole batch
+            items = msgspec.json.decode(response_text.strip(), type=List[msgspec.Raw])
+        except msgspec.DecodeError as e:
+            print(f"⚠️ Failed to parse LLM JSON response: {e}")
+            print(f"   Raw response: {response_text[:200]}...")
+            return [self._fallback_selection(resumes) for _ in range(count)]
+        
+        results: List[Optional[Dict]] = [None] * count
+        for item in items:
+            try:
+                match = msgspec.json.decode(item, type=BatchMatchResult, strict=False)
+                if 0 <= match.job_index < count and results[match.job_index] is None:
+                    results[match.job_index] = self._validate_match(match, resumes)
+            except Exception as e:
+                print(f"⚠️ Error validating LLM response: {e}")
+        
+        return [r if r is not None else self._fallback_selection(resumes) for r in results]
+    
+    
+    def _validate_match(self, match: "MatchResult", resumes: Dict) -> Dict:
+        """
+        Check the selected resume exists and normalize the scores.
+        Raises ValueError if the selection is unusable.
+        """
+        selected = match.selected_resume
+        
+        # Validate selected resume exists
+        if selected not in resumes:
+            # Try to find closest match (case-insensitive)
+            selected_lower = selected.lower()
+            for filename in resumes.keys():
+                if filename.lower() == selected_lower:
+                    selected = filename
+                    break
+            else:
+                raise ValueError(f"Invalid resume: {selected}")
+        
+        # Normalize confidence to 0-1 range
+        confidence = match.confidence
+        if confidence > 1.0:
+            confidence = confidence / 100.0
+        
+        return {
+            'selected_resume': selected,
+            'confidence': max(0.0, min(1.0, confidence)),
+            'reasoning': match.reasoning,
+            'match_score': max(0, min(100, int(match.match_score))),
+            'key_matches': match.key_matches
+        }
+    
+    
     def _fallback_selection(self, resumes: Dict) -> Dict:
         """
         Fallback: return first resume if LLM fails.
@@ -212,7 +526,8 @@ Rules:
             'confidence': 0.5,
             'reasoning': 'Fallback selection due to LLM error',
             'match_score': 50,
-            'key_matches': []
+            'key_matches': [],
+            'fallback': True
         }
     
     
@@ -272,6 +587,12 @@ Rules:
                 'key_skills': ['Python', 'AWS', 'Docker']
             }
         """
+        cache_key = self._cache_key("info", job_description[:2000])
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._save_response_cache()  # Persist the refreshed used_at (LRU order)
+            return cached
+        
         prompt = f"""Extract key information from this job description in JSON format:
 
 {job_description[:2000]}
@@ -287,13 +608,10 @@ Respond ONLY with JSON (no markdown):
         
         try:
             response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-            
-            # Clean markdown if present
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
-            
-            return json.loads(result_text.strip())
+            info = json.loads(response.text.strip())
+            self._cache_put(cache_key, info)
+            self._save_response_cache()
+            return info
             
         except Exception as e:
             print(f"⚠️ Could not extract job info: {e}")
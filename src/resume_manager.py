@@ -8,12 +8,117 @@ Handles all resume-related operations:
 """
 
 import os
+import re
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 import PyPDF2
 
 
+def extract_pdf_text(pdf_path: Path) -> str:
+    """
+    Extract text from a PDF file.
+    Module-level so it can run in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Extracted text content (cleaned)
+    """
+    text_content = []
+    
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        
+        for page_num, page in enumerate(pdf_reader.pages):
+            try:
+                page_text = page.extract_text()
+                if page_text:
+                    text_content.append(page_text)
+            except Exception as e:
+                print(f"      ⚠️ Warning: Failed to read page {page_num + 1}: {e}")
+    
+    # Join all pages and clean up
+    full_text = "\n\n".join(text_content)
+    return clean_text(full_text)
+
+
+def clean_text(text: str) -> str:
+    """
+    Clean extracted text (remove extra whitespace, fix encoding issues).
+    """
+    # Replace multiple newlines with double newline
+    text = '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+    
+    # Remove excessive spaces
+    text = re.sub(r' +', ' ', text)
+    
+    # Fix common encoding issues
+    text = text.replace('\u2019', "'")  # Smart apostrophe
+    text = text.replace('\u2013', "-")  # En dash
+    text = text.replace('\u2014', "--") # Em dash
+    text = text.replace('\u201c', '"')  # Smart quote left
+    text = text.replace('\u201d', '"')  # Smart quote right
+    
+    return text.strip()
+
+
+def parse_resumes(pdf_paths: List[Path]) -> Dict[str, Dict]:
+    """
+    Parse many resume PDFs, one worker process per CPU (PDF parsing is CPU-bound).
+    
+    Returns:
+        Dictionary of {filename: resume_data}; files that fail are skipped
+    """
+    pdf_paths = [Path(p) for p in pdf_paths]
+    resumes: Dict[str, Dict] = {}
+    if not pdf_paths:
+        return resumes
+    
+    for pdf_path in pdf_paths:
+        print(f"📄 Parsing {pdf_path.name}...")
+    
+    if len(pdf_paths) == 1:
+        # Not worth starting a process for a single file
+        outcomes = [_try_extract(pdf_paths[0])]
+    else:
+        workers = min(len(pdf_paths), os.cpu_count() or 1)
+        # "spawn", not fork: callers (LLMEngine) may already have gRPC threads running,
+        # and a forked child of a gRPC process can hang
+        spawn = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) as pool:
+            outcomes = list(pool.map(_try_extract, pdf_paths))
+    
+    for pdf_path, (text, error) in zip(pdf_paths, outcomes):
+        if error:
+            print(f"   ❌ Failed to parse {pdf_path.name}: {error}")
+            continue
+        
+        stat = pdf_path.stat()
+        resumes[pdf_path.name] = {
+            'filename': pdf_path.name,
+            'path': str(pdf_path.absolute()),
+            'text': text,
+            'word_count': len(text.split()),
+            'size_kb': stat.st_size / 1024,
+            'mtime': stat.st_mtime
+        }
+        print(f"   ✓ {pdf_path.name}: extracted {resumes[pdf_path.name]['word_count']} words")
+    
+    return resumes
+
+
+def _try_extract(pdf_path: Path):
+    """(text, None) on success, (None, error message) on failure."""
+    try:
+        return extract_pdf_text(pdf_path), None
+    except Exception as e:
+        return None, str(e)
+
+
 class ResumeManager:
     def __init__(self, resumes_dir: str = "data/resumes"):
         """
@@ -61,11 +166,18 @@ class ResumeManager:
         """
         Check if cached data matches current PDF files.
         """
-        pdf_files = set(f.name for f in self.resumes_dir.glob("*.pdf"))
+        pdf_files = {f.name: f for f in self.resumes_dir.glob("*.pdf")}
         cached_files = set(cached_data.keys())
-        
-        # Cache is valid if file lists match
-        return pdf_files == cached_files
+
+        # Cache is valid if file lists match...
+        if set(pdf_files) != cached_files:
+            return False
+
+        # ...and no PDF was edited since it was parsed
+        return all(
+            cached_data[name].get('mtime') == path.stat().st_mtime
+            for name, path in pdf_files.items()
+        )
     
     
     def _scan_and_parse_pdfs(self):
@@ -79,79 +191,11 @@ class ResumeManager:
             print(f"   Please add resume PDFs like: frontend.pdf, backend.pdf, fullstack.pdf")
             return
         
-        for pdf_path in pdf_files:
-            try:
-                print(f"📄 Parsing {pdf_path.name}...")
-                text = self._extract_text_from_pdf(pdf_path)
-                
-                # Store resume data
-                self.resumes[pdf_path.name] = {
-                    'filename': pdf_path.name,
-                    'path': str(pdf_path.absolute()),
-                    'text': text,
-                    'word_count': len(text.split()),
-                    'size_kb': pdf_path.stat().st_size / 1024
-                }
-                
-                print(f"   ✓ Extracted {len(text.split())} words")
-                
-            except Exception as e:
-                print(f"   ❌ Failed to parse {pdf_path.name}: {e}")
+        self.resumes = parse_resumes(pdf_files)
         
         print(f"\n✅ Successfully loaded {len(self.resumes)} resumes")
     
     
-    def _extract_text_from_pdf(self, pdf_path: Path) -> str:
-        """
-        Extract text from a PDF file.
-        
-        Args:
-            pdf_path: Path to the PDF file
-            
-        Returns:
-            Extracted text content (cleaned)
-        """
-        text_content = []
-        
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                except Exception as e:
-                    print(f"      ⚠️ Warning: Failed to read page {page_num + 1}: {e}")
-        
-        # Join all pages and clean up
-        full_text = "\n\n".join(text_content)
-        cleaned_text = self._clean_text(full_text)
-        
-        return cleaned_text
-    
-    
-    def _clean_text(self, text: str) -> str:
-        """
-        Clean extracted text (remove extra whitespace, fix encoding issues).
-        """
-        # Replace multiple newlines with double newline
-        text = '\n'.join(line.strip() for line in text.splitlines() if line.strip())
-        
-        # Remove excessive spaces
-        import re
-        text = re.sub(r' +', ' ', text)
-        
-        # Fix common encoding issues
-        text = text.replace('\u2019', "'")  # Smart apostrophe
-        text = text.replace('\u2013', "-")  # En dash
-        text = text.replace('\u2014', "--") # Em dash
-        text = text.replace('\u201c', '"')  # Smart quote left
-        text = text.replace('\u201d', '"')  # Smart quote right
-        
-        return text.strip()
-    
-    
     def _save_cache(self):
         """
         Save parsed resumes to cache file.
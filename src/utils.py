@@ -1,3 +1,4 @@
+import asyncio
 import time
 import random
 import math
@@ -6,7 +7,7 @@ import math
 #  HUMANIZATION LAYER - AVOID DETECTION
 # ============================================================
 
-def human_sleep(min_seconds=2, max_seconds=5, variance=0.3):
+async def human_sleep(min_seconds=2, max_seconds=5, variance=0.3):
     """
     Advanced sleep with occasional 'distraction' pauses.
     
@@ -22,10 +23,10 @@ def human_sleep(min_seconds=2, max_seconds=5, variance=0.3):
         distraction = random.uniform(2, 8)
         base_sleep += distraction
     
-    time.sleep(base_sleep)
+    await asyncio.sleep(base_sleep)
 
 
-def human_type(page, selector, text, delay_min=50, delay_max=150, 
+async def human_type(page, selector, text, delay_min=50, delay_max=150, 
                mistake_probability=0.05, pause_probability=0.15):
     """
     Types with realistic human behavior:
@@ -39,20 +40,20 @@ def human_type(page, selector, text, delay_min=50, delay_max=150,
     """
     try:
         element = page.locator(selector)
-        element.click()  # Focus the field first
-        human_sleep(0.1, 0.3)
+        await element.click()  # Focus the field first
+        await human_sleep(0.1, 0.3)
         
         for i, char in enumerate(text):
             # Occasionally make a typo
             if random.random() < mistake_probability:
                 wrong_char = random.choice('qwertyuiopasdfghjklzxcvbnm')
-                element.press(wrong_char)
-                time.sleep(random.uniform(0.1, 0.3))
-                element.press('Backspace')
-                time.sleep(random.uniform(0.05, 0.15))
+                await element.press(wrong_char)
+                await asyncio.sleep(random.uniform(0.1, 0.3))
+                await element.press('Backspace')
+                await asyncio.sleep(random.uniform(0.05, 0.15))
             
             # Type the correct character
-            element.press(char)
+            await element.press(char)
             
             # Variable typing speed (humans slow down on complex chars)
             if char in '!@#$%^&*()_+-={}[]|\\:";\'<>?,./':
@@ -60,17 +61,17 @@ def human_type(page, selector, text, delay_min=50, delay_max=150,
             else:
                 delay = random.uniform(delay_min, delay_max)
             
-            time.sleep(delay / 1000)  # Convert ms to seconds
+            await asyncio.sleep(delay / 1000)  # Convert ms to seconds
             
             # Random pauses (like thinking or reading)
             if random.random() < pause_probability:
-                time.sleep(random.uniform(0.3, 1.2))
+                await asyncio.sleep(random.uniform(0.3, 1.2))
         
     except Exception as e:
         print(f"⚠️ Could not type in {selector}: {e}")
 
 
-def human_scroll(page, read_time=True):
+async def human_scroll(page, read_time=True):
     """
     Scrolls like a human reading content:
     - Variable scroll speeds
@@ -79,8 +80,8 @@ def human_scroll(page, read_time=True):
     """
     try:
         # Get page height
-        page_height = page.evaluate("document.body.scrollHeight")
-        viewport_height = page.evaluate("window.innerHeight")
+        page_height = await page.evaluate("document.body.scrollHeight")
+        viewport_height = await page.evaluate("window.innerHeight")
         
         current_position = 0
         
@@ -93,36 +94,36 @@ def human_scroll(page, read_time=True):
             steps = random.randint(10, 20)
             for step in range(steps):
                 micro_scroll = scroll_distance / steps
-                page.mouse.wheel(0, micro_scroll)
-                time.sleep(0.02)  # 20ms between micro-scrolls
+                await page.mouse.wheel(0, micro_scroll)
+                await asyncio.sleep(0.02)  # 20ms between micro-scrolls
             
             current_position += scroll_distance
             
             # Pause to "read" (if enabled)
             if read_time:
-                time.sleep(random.uniform(1, 3))
+                await asyncio.sleep(random.uniform(1, 3))
             
             # 20% chance to scroll back up slightly (re-reading)
             if random.random() < 0.2:
-                page.mouse.wheel(0, -random.randint(50, 200))
-                time.sleep(random.uniform(0.5, 1.5))
+                await page.mouse.wheel(0, -random.randint(50, 200))
+                await asyncio.sleep(random.uniform(0.5, 1.5))
         
         # Final pause at bottom
-        human_sleep(1, 2)
+        await human_sleep(1, 2)
         
     except Exception as e:
         print(f"⚠️ Scrolling failed: {e}")
 
 
-def human_mouse_move(page, x, y, duration=0.5):
+async def human_mouse_move(page, x, y, duration=0.5):
     """
     Moves mouse in a curved path (Bezier-like) instead of straight line.
     Mimics natural hand movement.
     """
     try:
         # Get current mouse position
-        current_x = page.evaluate("window.mouseX || window.innerWidth / 2")
-        current_y = page.evaluate("window.mouseY || window.innerHeight / 2")
+        current_x = await page.evaluate("window.mouseX || window.innerWidth / 2")
+        current_y = await page.evaluate("window.mouseY || window.innerHeight / 2")
         
         # Generate curve control points
         control_x1 = current_x + random.uniform(-100, 100)
@@ -140,43 +141,48 @@ def human_mouse_move(page, x, y, duration=0.5):
             by = (1-t)**3 * current_y + 3*(1-t)**2*t * control_y1 + \
                  3*(1-t)*t**2 * control_y2 + t**3 * y
             
-            page.mouse.move(bx, by)
-            time.sleep(duration / steps)
+            await page.mouse.move(bx, by)
+            await asyncio.sleep(duration / steps)
         
         # Store final position
-        page.evaluate(f"window.mouseX = {x}; window.mouseY = {y}")
+        await page.evaluate(f"window.mouseX = {x}; window.mouseY = {y}")
         
     except Exception as e:
         print(f"⚠️ Mouse move failed: {e}")
 
 
-def human_click(page, selector, move_mouse=True):
+async def human_click(page, selector, move_mouse=True, pause_after=True):
     """
     Clicks with human-like behavior:
     - Moves mouse to element first
     - Slight position randomness (doesn't click center pixel)
     - Brief hover before click
+    
+    Args:
+        selector: CSS selector string or an already-resolved Locator
+        pause_after: Sleep after clicking (turn off when the caller waits on the DOM instead)
     """
     try:
-        element = page.locator(selector)
-        box = element.bounding_box()
+        element = page.locator(selector) if isinstance(selector, str) else selector
+        box = await element.bounding_box()
         
         if box and move_mouse:
             # Click random point within element (not always center)
             click_x = box['x'] + box['width'] * random.uniform(0.3, 0.7)
             click_y = box['y'] + box['height'] * random.uniform(0.3, 0.7)
             
-            human_mouse_move(page, click_x, click_y, duration=random.uniform(0.3, 0.7))
-            time.sleep(random.uniform(0.1, 0.3))  # Brief hover
+            await human_mouse_move(page, click_x, click_y, duration=random.uniform(0.3, 0.7))
+            await asyncio.sleep(random.uniform(0.1, 0.3))  # Brief hover
         
-        element.click()
-        human_sleep(0.5, 1.5)
+        await element.click()
+        if pause_after:
+            await human_sleep(0.5, 1.5)
         
     except Exception as e:
         print(f"⚠️ Could not click {selector}: {e}")
 
 
-def random_micro_movements(page, duration=10):
+async def random_micro_movements(page, duration=10):
     """
     Simulates idle mouse movements (like a user reading).
     Call this occasionally when the bot is "waiting" for pages to load.
@@ -187,20 +193,20 @@ def random_micro_movements(page, duration=10):
             # Small random movements
             dx = random.randint(-50, 50)
             dy = random.randint(-30, 30)
-            page.mouse.move(dx, dy, steps=random.randint(3, 8))
-            time.sleep(random.uniform(0.5, 2))
+            await page.mouse.move(dx, dy, steps=random.randint(3, 8))
+            await asyncio.sleep(random.uniform(0.5, 2))
     except:
         pass
 
 
-def simulate_reading_pattern(page, selector):
+async def simulate_reading_pattern(page, selector):
     """
     Simulates reading text by moving mouse over it.
     Use this for job descriptions before clicking "Apply".
     """
     try:
         element = page.locator(selector)
-        box = element.bounding_box()
+        box = await element.bounding_box()
         
         if box:
             # Start at top-left of text
@@ -211,10 +217,10 @@ def simulate_reading_pattern(page, selector):
             for line in range(random.randint(3, 6)):
                 # Move right (reading)
                 end_x = x + random.uniform(200, 400)
-                human_mouse_move(page, end_x, y, duration=random.uniform(0.8, 1.5))
+                await human_mouse_move(page, end_x, y, duration=random.uniform(0.8, 1.5))
                 
                 # Move down to next line
                 y += random.uniform(20, 35)
-                time.sleep(random.uniform(0.3, 0.8))
+                await asyncio.sleep(random.uniform(0.3, 0.8))
     except:
         pass
\ No newline at end of file